@@ -34,82 +34,278 @@
 # You are encouraged to make design decisions based on your understanding of the problem and the requirements provided, but usage of object oriented approach with abstractions will be considered as an advantage.
 
 import os
+import re
+import sys
+import html
+import asyncio
+import hashlib
+import httpx
+import aiofiles
+from aiolimiter import AsyncLimiter
 import bs4
-import requests
-from bs4 import BeautifulSoup
-import json
-import time
-from fastapi import FastAPI
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+import orjson
+from uuid import uuid4
+from fastapi import FastAPI, BackgroundTasks
 from typing import Optional, Union
 from fastapi.params import Query, Header
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# selectolax (Lexbor) is a C-backed HTML5 parser, an order of magnitude faster
+# than bs4 on real pages. Fall back to BeautifulSoup when it isn't installed.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# redis is optional: the endpoint falls back to JSON-file storage without it
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Restrict the bs4 fallback to the product <ul> subtree so no DOM is built
+# for the rest of the page. Allocated once at module level.
+_PRODUCTS_STRAINER = SoupStrainer("ul", attrs={"class": "products columns-4"})
+
+# Selectors for the bs4 fallback, compiled once so SoupSieve matches them
+# in C instead of re-parsing the selector per product
+_SEL_TITLE = soupsieve.compile("a.button")
+_SEL_IMG = soupsieve.compile("img.attachment-woocommerce_thumbnail")
+_SEL_PRICE = soupsieve.compile("span.price")
+
+# First rupee-prefixed amount in a price string, e.g. "₹1,234.00"
+_PRICE_RE = re.compile(r"₹\s*([\d,]+(?:\.\d+)?)")
+
+# Fast path for the known Dentalstall listing shape: every product <li>
+# inside ul.products.columns-4 carries a data-title on its button link, a
+# thumbnail <img> and a price <span>. The page is first cut to the product
+# UL, then to individual <li> blocks, and the three fields are searched
+# within each block independently of their order (WooCommerce renders the
+# button after the image and price). Scanning the raw bytes this way skips
+# tree construction entirely; the tree parsers remain as the fallback
+# whenever the shape doesn't hold
+_PRODUCTS_UL_RE = re.compile(rb'<ul[^>]*class="[^"]*products columns-4[^"]*"[^>]*>(.*?)</ul>', re.DOTALL)
+_LI_RE = re.compile(rb'<li[^>]*>(.*?)</li>', re.DOTALL)
+_LI_OPEN_RE = re.compile(rb'<li[\s>]')
+_DATA_TITLE_RE = re.compile(rb'data-title="([^"]+)"')
+_THUMB_IMG_RE = re.compile(rb'<img[^>]*class="[^"]*attachment-woocommerce_thumbnail[^"]*"[^>]*>')
+_PRICE_SPAN_RE = re.compile(rb'<span class="price">(.*)', re.DOTALL)
+_LAZY_SRC_RE = re.compile(rb'data-lazy-src="([^"]+)"')
+_SRC_RE = re.compile(rb'src="([^"]+)"')
+_TAG_RE = re.compile(rb"<[^>]+>")
+
+
+# Sentinel returned by fetch_page when the origin answers 304 Not Modified:
+# the page is unchanged since the last scrape and needs no parsing at all
+NOT_MODIFIED = object()
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price: str) -> float:
+    """
+    Convert a numeric price string (commas allowed) to a float.
+    Cached because the same price strings repeat across pages.
+    """
+    return float(price.replace(",", ""))
 
 
 
 class Scraper:
-    def __init__(self, proxy: Union[str, None] = None):
+    def __init__(self, proxy: Union[str, None] = None, max_rate: float = 5.0):
         """
         proxy: str or None - URL of the proxy server, or None for no proxy
+        max_rate: float - maximum page requests per second
         """
         self.proxy = proxy
         self.retry_delay = 5  # Retry delay in seconds
-    
-    def fetch_page(self, url: str, max_retries: int = 3) -> Union[str, None]:
+        # One shared HTTP/2 client per scrape run: dozens of in-flight
+        # requests multiplex over a single TLS connection, so the handshake
+        # is paid once for the whole session. The token bucket keeps us
+        # polite: bursts are allowed up to max_rate per second without ever
+        # sleeping when the server has capacity
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30.0,
+            proxy=proxy,
+            # httpx doesn't follow redirects by default the way requests and
+            # aiohttp do; without this, WordPress canonical 301s (e.g. for
+            # the shop//page/N double slash) would burn every retry
+            follow_redirects=True,
+        )
+        self.limiter = AsyncLimiter(max_rate, 1)
+        # HTTP validators per page URL: {url: [etag, last_modified]},
+        # loaded from storage by the manager before a run
+        self.page_meta: dict[str, list] = {}
+
+    async def close(self):
+        """
+        Release the underlying HTTP client
+        """
+        await self.session.aclose()
+
+    async def fetch_page(self, url: str, max_retries: int = 3) -> Union[bytes, None]:
         """
         Retrieve the HTML content of a web page
         url: str - URL of the page to fetch
         max_retries: int - Maximum number of retries to attempt
-        Returns str or None if the page could not be fetched
+        Returns raw bytes, NOT_MODIFIED when the origin reports the page
+        unchanged, or None if the page could not be fetched
         """
         print(url)
+        # Send the stored validators so an unchanged page costs a 304
+        # with zero body bytes instead of a full transfer
+        headers = {}
+        meta = self.page_meta.get(url)
+        if meta:
+            if meta[0]:
+                headers["If-None-Match"] = meta[0]
+            if meta[1]:
+                headers["If-Modified-Since"] = meta[1]
         retries = 0
         while retries < max_retries:
             try:
-                if self.proxy:
-                    response = requests.get(url, proxies={"http": self.proxy, "https": self.proxy})
-                else:
-                    response = requests.get(url)
-                
+                async with self.limiter:
+                    response = await self.session.get(url, headers=headers)
+                if response.status_code == 304:
+                    return NOT_MODIFIED
                 if response.status_code == 200:
-                    return str(response.content)
-                else:
-                    print(f"Failed to fetch page: {url}. Status code: {response.status_code}.\nRetrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self.page_meta[url] = [etag, last_modified]
+                    # Return the body undecoded; both HTML parsers accept
+                    # bytes and sniff the charset themselves, so decoding
+                    # here would only add a full string copy per page
+                    return response.content
+                print(f"Failed to fetch page: {url}. Status code: {response.status_code}.\nRetrying in {self.retry_delay} seconds...")
+                await asyncio.sleep(self.retry_delay)
             except Exception as e:
                 print(f"Error fetching page: {e}")
-            
+
             retries += 1
-        
+
         print(f"Failed to fetch page after {max_retries} retries: {url}")
         return None
     
-    def scrape_product_info(self, html_content: str) -> list[dict[str, Union[str, float]]]:
+    def scrape_product_info(self, html_content: bytes) -> list[dict[str, Union[str, float]]]:
         """
         Scrape product information from a page
-        html_content: str - HTML content of the page
+        html_content: bytes - raw HTML content of the page
         Returns list of products, where each product is a dict with fields:
             "product_title" (str), "image_src" (str), "product_price" (float)
         """
 
-        # TODO(in future scope):
-        # We can do multithreading here to speed up the scraping process,
-        # keep _scrape_product_info logic in a seperate function for that
-        
-        # Parse the HTML content
-        soup = BeautifulSoup(html_content, "html.parser")
+        # The regex fast path knows the Dentalstall DOM shape; when it finds
+        # nothing (layout change) fall back to a real HTML parser
+        products = self._scrape_products_fast(html_content)
+        if products:
+            return products
+
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html_content)
+            return [self._scrape_product_info(node) for node in tree.css("ul.products.columns-4 > li")]
 
-        # Find the product listings
-        products_ul = soup.find("ul", class_="products columns-4")
+        # Fallback: parse with BeautifulSoup, materializing only the product subtree
+        soup = BeautifulSoup(html_content, "lxml", parse_only=_PRODUCTS_STRAINER)
+
+        # Find the product listings (the strainer kept nothing else)
+        products_ul = soup.find("ul")
         if products_ul:
             # Extract information for each product
             products = []
             for li_element in products_ul.find_all("li"):
-                product = self._scrape_product_info(li_element)
+                product = self._scrape_product_info_bs4(li_element)
                 products.append(product)
 
             return products
         return []
 
-    def _scrape_product_info(self, li_element: bs4.element.Tag) -> dict[str, Union[str, float]]:
+    def _scrape_products_fast(self, html_content: bytes) -> list[dict[str, Union[str, float]]]:
+        """
+        Extract products by scanning the raw page bytes with pre-compiled
+        regexes, skipping HTML tree construction entirely
+        html_content: bytes - raw HTML content of the page
+        Returns the same product dicts as the parser paths, or an empty
+        list when the page does not match the expected shape
+        """
+        # Only product ULs are scanned so sidebar/related-product widgets
+        # elsewhere on the page can't leak into the results; every matching
+        # UL contributes, as the tree parsers would see them all
+        products: list[dict[str, Union[str, float]]] = []
+        for ul_match in _PRODUCTS_UL_RE.finditer(html_content):
+            region = ul_match.group(1)
+            li_blocks = _LI_RE.findall(region)
+            # A nested <ul> inside a product li would end the non-greedy
+            # capture early and a nested <li> would split a block; either
+            # way the open-tag count disagrees with the blocks we cut, and
+            # a shortened or mispaired list must go to the tree parser
+            if len(_LI_OPEN_RE.findall(region)) != len(li_blocks):
+                return []
+            for li_block in li_blocks:
+                title_match = _DATA_TITLE_RE.search(li_block)
+                if not title_match:
+                    # An li without a data-title means the markup doesn't have
+                    # the expected shape; hand the whole page to the tree parser
+                    # rather than return a partial (possibly mispaired) list
+                    return []
+                img_match = _THUMB_IMG_RE.search(li_block)
+                src = None
+                if img_match:
+                    img_tag = img_match.group(0)
+                    src = _LAZY_SRC_RE.search(img_tag) or _SRC_RE.search(img_tag)
+                # The price span nests currency/amount markup; strip the tags to
+                # get the same text a tree parser would hand back
+                price_match = _PRICE_SPAN_RE.search(li_block)
+                price_text = _TAG_RE.sub(b"", price_match.group(1)).decode("utf-8", "replace") if price_match else ""
+                # Unescape entities (&amp;, &#8377;, ...) so titles, URLs and
+                # price text are byte-identical with what the tree parsers
+                # produce - the title is the cache key, so a diverging escape
+                # would split one product into two rows
+                products.append({
+                    "product_title": html.unescape(title_match.group(1).decode("utf-8", "replace")).strip(),
+                    "image_src": html.unescape(src.group(1).decode("utf-8", "replace")) if src else "",
+                    "product_price": self._parse_price_text(html.unescape(price_text)),
+                })
+        return products
+
+    def _scrape_product_info(self, node) -> dict[str, Union[str, float]]:
+        """
+        Extract product information from a single product listing
+        node: selectolax.lexbor.LexborNode - Product listing HTML element
+        Returns dict with fields:
+            "product_title" (str), "image_src" (str), "product_price" (float)
+        """
+        # Locals are fully typed so the module stays compilable with mypyc
+        # should parsing ever become the bottleneck at larger scale
+        product: dict[str, Union[str, float]] = {}
+
+        # Extract title
+        title_element = node.css_first("a.button")
+        title: str = (title_element.attributes.get("data-title") or "").strip() if title_element else ""
+        product["product_title"] = title
+
+        # Extract image source (lazy-loaded images keep the real URL in data-lazy-src)
+        image_element = node.css_first("img.attachment-woocommerce_thumbnail")
+        image_src: str = ""
+        if image_element:
+            attrs: dict = image_element.attributes
+            image_src = attrs.get("data-lazy-src") or attrs.get("src") or ""
+        product["image_src"] = image_src
+
+        # Extract price
+        price_element = node.css_first("span.price")
+        price: float = self._parse_price_text(price_element.text()) if price_element else 0.0
+        product["product_price"] = price
+
+        return product
+
+    def _scrape_product_info_bs4(self, li_element: bs4.element.Tag) -> dict[str, Union[str, float]]:
         """
         Extract product information from a single product listing
         li_element: bs4.element.Tag - Product listing HTML element
@@ -117,14 +313,14 @@ class Scraper:
             "product_title" (str), "image_src" (str), "product_price" (float)
         """
         product: dict[str, Union[str, float]] = {}
-        
+
         # Extract title
-        title_element = li_element.find(lambda tag: tag.name == "a" and "button" in tag.get("class", []))
+        title_element = _SEL_TITLE.select_one(li_element)
         product["product_title"] = title_element.get("data-title", "").strip() if title_element else ""
         assert isinstance(product["product_title"], str)
 
         # Extract image source
-        image_element = li_element.find("img", class_="attachment-woocommerce_thumbnail")
+        image_element = _SEL_IMG.select_one(li_element)
         if image_element:
             if "data-lazy-src" in image_element.attrs:
                 product["image_src"] = image_element["data-lazy-src"]
@@ -136,28 +332,53 @@ class Scraper:
         assert isinstance(product["image_src"], str)
 
         # Extract price
-        price_element = li_element.find("span", class_="price")
-        if price_element:
-            price_text = price_element.text.strip()
-            # Check if price contains "Starting at:"
-            if "Starting at:" in price_text:
-                # Remove "Starting at:" prefix with rupee symbol
-                price_text = price_text.replace("Starting at:", "").strip()
-
-            # Extract only the first price (assuming it's the current price) 
-            price_text = price_text.split("\u20b9")[1].strip()
-            product["product_price"] = float(price_text) if price_text else 0.0
-            assert isinstance(product["product_price"], float)
-        else:
-            product["product_price"] = 0.0
-            assert isinstance(product["product_price"], float)
+        price_element = _SEL_PRICE.select_one(li_element)
+        product["product_price"] = self._parse_price_text(price_element.text) if price_element else 0.0
+        assert isinstance(product["product_price"], float)
 
         return product
 
+    @staticmethod
+    def _parse_price_text(price_text: str) -> float:
+        """
+        Convert the raw price text of a listing to a float
+        price_text: str - text content of the price element
+        Returns the first price found, or 0.0 when the text holds none
+        """
+        # One regex scan replaces the strip/replace/split chain; prefixes like
+        # "Starting at:" fall away because only the amount group is captured
+        match = _PRICE_RE.search(price_text)
+        return _parse_price(match.group(1)) if match else 0.0
 
 
 
 
+
+class Product(BaseModel):
+    """
+    Stored shape of a scraped product, used to validate data at the
+    storage boundary in one Rust-backed pass instead of per-row asserts
+    """
+    product_title: str
+    product_price: float
+    path_to_image: str
+
+
+_PRODUCT_LIST_ADAPTER = TypeAdapter(list[Product])
+
+
+@dataclass(slots=True)
+class Entry:
+    """
+    In-memory cache record for one product. Slots keep per-entry memory
+    small, and orjson serializes dataclasses directly so saving needs no
+    intermediate list of dicts.
+    """
+    product_title: str
+    product_price: float
+    path_to_image: str
+
+
 class LocalStorage:
     """
     Local storage class for storing scraped data as JSON
@@ -170,22 +391,20 @@ class LocalStorage:
         file_path: str - path to JSON file where data will be stored
         """
         self.file_path = file_path
+        # Page validators (ETag/Last-Modified) live next to the data file
+        self.meta_path = f"{file_path}.meta"
     
-    def save_to_json(self, data: list):
+    def save(self, entries: list["Entry"], dirty_titles: Union[set, None] = None):
         """
-        Save data to JSON file at self.file_path
+        Save cache entries to JSON file at self.file_path
 
-        data: list - list of dicts with product information
+        entries: list[Entry] - cache entries to persist
+        dirty_titles: set or None - titles changed this session; unused here,
+            a JSON file has to be rewritten in full either way
         """
-        assert isinstance(data, list)
-        for item in data:
-            assert isinstance(item, dict)
-            assert {"product_title", "product_price", "path_to_image"} <= set(item.keys())
-            assert isinstance(item["product_title"], str)
-            assert isinstance(item["product_price"], float)
-            assert isinstance(item["path_to_image"], str)
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        assert isinstance(entries, list)
+        with open(self.file_path, 'wb') as f:
+            f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
         print(f"Data saved to {self.file_path}")
     
     def load_from_json(self) -> list:
@@ -195,26 +414,126 @@ class LocalStorage:
         Returns list of dicts with product information
         """
         try:
-            with open(self.file_path, 'r') as f:
-                data = json.load(f)
+            with open(self.file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             assert isinstance(data, list)
-            for item in data:
-                assert isinstance(item, dict)
-                assert {"product_title", "product_price", "path_to_image"} <= set(item.keys())
-                assert isinstance(item["product_title"], str)
-                assert isinstance(item["product_price"], float)
-                assert isinstance(item["path_to_image"], str)
             return data
         except FileNotFoundError:
             print(f"No data found at {self.file_path}")
             return []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print(f"Error decoding JSON data in {self.file_path}")
             return []
         except AssertionError:
             print(f"Data integrity error in {self.file_path}")
             return []
 
+    def load_page_meta(self) -> dict:
+        """
+        Load per-page HTTP validators ({url: [etag, last_modified]})
+        """
+        try:
+            with open(self.meta_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+    def save_page_meta(self, page_meta: dict):
+        """
+        Persist per-page HTTP validators for the next scrape
+
+        page_meta: dict - {url: [etag, last_modified]}
+        """
+        with open(self.meta_path, 'wb') as f:
+            f.write(orjson.dumps(page_meta))
+
+
+class RedisStorage:
+    """
+    Redis-backed storage with the same interface as LocalStorage.
+    Products live in a single hash keyed by title, so a re-scrape only
+    writes the rows that actually changed instead of rewriting everything.
+    """
+    def __init__(self, host: str = "localhost", port: int = 6379, hash_key: str = "products"):
+        """
+        Initialize RedisStorage object and verify the server is reachable
+
+        host: str - Redis server host
+        port: int - Redis server port
+        hash_key: str - name of the hash holding the product map
+        """
+        assert redis is not None, "redis package is not installed"
+        self.hash_key = hash_key
+        self.client = redis.Redis(host=host, port=port, decode_responses=True)
+        self.client.ping()
+
+    def save(self, entries: list["Entry"], dirty_titles: Union[set, None] = None):
+        """
+        Save cache entries to the Redis hash
+
+        entries: list[Entry] - cache entries to persist
+        dirty_titles: set or None - titles changed this session; when given,
+            only those rows are written
+        """
+        assert isinstance(entries, list)
+        rows = entries if dirty_titles is None else [e for e in entries if e.product_title in dirty_titles]
+        if not rows:
+            print(f"No changed products to save to Redis hash '{self.hash_key}'")
+            return
+        # Buffer every HSET in one pipeline so the session pays a single
+        # round-trip instead of one per changed product; no transaction
+        # needed since each field write is independent
+        with self.client.pipeline(transaction=False) as pipe:
+            for entry in rows:
+                pipe.hset(
+                    self.hash_key,
+                    entry.product_title,
+                    orjson.dumps({"price": entry.product_price, "path": entry.path_to_image}),
+                )
+            pipe.execute()
+        print(f"{len(rows)} products saved to Redis hash '{self.hash_key}'")
+
+    def load_from_json(self) -> list:
+        """
+        Load data from the Redis hash
+
+        Returns list of dicts with product information
+        """
+        try:
+            raw = self.client.hgetall(self.hash_key)
+        except redis.RedisError as e:
+            print(f"Error loading data from Redis: {e}")
+            return []
+        data = []
+        for title, payload in raw.items():
+            item = orjson.loads(payload)
+            data.append({
+                "product_title": title,
+                "product_price": float(item["price"]),
+                "path_to_image": item["path"],
+            })
+        return data
+
+    def load_page_meta(self) -> dict:
+        """
+        Load per-page HTTP validators ({url: [etag, last_modified]})
+        """
+        try:
+            raw = self.client.get(f"{self.hash_key}:page_meta")
+        except redis.RedisError as e:
+            print(f"Error loading page metadata from Redis: {e}")
+            return {}
+        return orjson.loads(raw) if raw else {}
+
+    def save_page_meta(self, page_meta: dict):
+        """
+        Persist per-page HTTP validators for the next scrape
+
+        page_meta: dict - {url: [etag, last_modified]}
+        """
+        self.client.set(f"{self.hash_key}:page_meta", orjson.dumps(page_meta))
+
+
 class Notifier:
     """
     Class for sending notifications. In future scope, we might use different forms of notifier
@@ -241,16 +560,26 @@ class ScrapingManager:
         notifier: Notifier - instance of notifier class
         """
         assert isinstance(scraper, Scraper)
-        assert isinstance(storage, LocalStorage)
+        assert isinstance(storage, (LocalStorage, RedisStorage))
         assert isinstance(notifier, Notifier)
         self.scraper = scraper
         self.storage = storage
         self.notifier = notifier
-        self.data_cache: dict[str, list[float, str]] = {}
+        self.data_cache: dict[str, Entry] = {}
+        # Cap concurrent image downloads so a large page doesn't open
+        # hundreds of connections at once
+        self.image_semaphore = asyncio.Semaphore(20)
+        # Parsing is CPU-bound; Lexbor releases the GIL, so threads let all
+        # cores chew on pages at once without pickling overhead
+        self.pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Products actually created/updated this session: the count feeds the
+        # notifier, the titles let the storage write only changed rows
+        self.updated_count = 0
+        self.dirty_titles: set[str] = set()
         
 
     
-    def scrape_and_store(self, url: str, pages: int = 1):
+    async def scrape_and_store(self, url: str, pages: int = 1):
         """
         Scrape data from target website and store it in local storage
 
@@ -258,66 +587,98 @@ class ScrapingManager:
         pages: int - number of pages to scrape from
         """
         self.db_cache_fetch()
-        for page_num in range(1, pages + 1):
-            page_url = f"{url}/page/{page_num}"
-            html = self.scraper.fetch_page(page_url)
-            if html:
-                products_info = self.scraper.scrape_product_info(html)
-                self.db_cache_extend(products_info)
-                self.notifier.notify(f"{len(products_info)} products scraped from page {page_num}.")
-                print(products_info)
-                print()
-                print(len(self.data_cache),self.data_cache)
-                # time.sleep(1)  # Add a delay between requests
-        data = self.db_cache_to_dict()
-        self.storage.save_to_json(data)
+        self.scraper.page_meta = self.storage.load_page_meta()
+        # Fetch all pages concurrently - the workload is pure network waiting,
+        # so total wall-clock becomes the slowest page instead of the sum of all pages
+        tasks = [self.scraper.fetch_page(f"{url}/page/{page_num}") for page_num in range(1, pages + 1)]
+        htmls = await asyncio.gather(*tasks)
+        # Parse all fetched pages in parallel on the thread pool; pages the
+        # origin reported unchanged (304) skip parsing and everything after it
+        unchanged = sum(1 for html in htmls if html is NOT_MODIFIED)
+        if unchanged:
+            print(f"{unchanged} pages unchanged since last scrape, skipped.")
+        fetched = [
+            (page_num, html)
+            for page_num, html in enumerate(htmls, start=1)
+            if html is not None and html is not NOT_MODIFIED
+        ]
+        loop = asyncio.get_running_loop()
+        parsed = await asyncio.gather(
+            *[loop.run_in_executor(self.pool, self.scraper.scrape_product_info, html) for _, html in fetched]
+        )
+        scraped_count = 0
+        for (page_num, _), products_info in zip(fetched, parsed):
+            await self.db_cache_extend(products_info)
+            scraped_count += len(products_info)
+            self.notifier.notify(f"{len(products_info)} products scraped from page {page_num}.")
+            print(products_info)
+            print()
+            print(len(self.data_cache),self.data_cache)
+        self.storage.save(list(self.data_cache.values()), dirty_titles=self.dirty_titles)
+        self.storage.save_page_meta(self.scraper.page_meta)
+        self.notifier.notify(
+            f"Scraping session finished: {scraped_count} products scraped, {self.updated_count} updated in DB."
+        )
+
+    def close(self):
+        """
+        Release the parsing thread pool
+        """
+        self.pool.shutdown(wait=False)
 
     def db_cache_fetch(self):
         """
         Load data from local storage
         """
         data = self.storage.load_from_json()
-        assert isinstance(data, list)
-        for item in data:
-            assert isinstance(item, dict)
-            assert {"product_title", "product_price", "path_to_image"} <= set(item.keys())
-            assert isinstance(item["product_title"], str)
-            assert isinstance(item["product_price"], float)
-            assert isinstance(item["path_to_image"], str)
-        self.data_cache = {p["product_title"]: [p["product_price"], p["path_to_image"]] for p in data}
-
-    def db_cache_extend(self, products: list[dict[str, any]]):
+        try:
+            products = _PRODUCT_LIST_ADAPTER.validate_python(data)
+        except ValidationError as e:
+            # Malformed stored data shouldn't kill every scrape until the
+            # file is hand-fixed; start from an empty cache like the storage
+            # classes do on their own integrity errors
+            print(f"Data integrity error in stored data, starting fresh: {e}")
+            products = []
+        # Interned titles are shared with the copies the scraper produces
+        # later in the session, so each title exists once in memory
+        self.data_cache = {
+            sys.intern(p.product_title): Entry(sys.intern(p.product_title), p.product_price, p.path_to_image)
+            for p in products
+        }
+
+    async def db_cache_extend(self, products: list[dict[str, any]]):
         """
         Add new products to local storage cache
 
         products: List[Dict[str, Any]] - list of dicts with product information
         """
-        assert isinstance(products, list)
-        for product in products:
-            assert isinstance(product, dict)
-            assert {"product_title", "product_price", "image_src"} <= set(product.keys())
-            assert isinstance(product["product_title"], str)
-            assert isinstance(product["product_price"], float)
-            assert isinstance(product["image_src"], str)
+        # No validation loop here: the scraper itself guarantees the shape
+        # A product whose cached price is unchanged does zero work: no image
+        # download, no cache mutation, no later write. New products get their
+        # image fetched concurrently in one batch; a price change on a known
+        # product only updates the cached price (the image is already on disk).
+        to_download = []
         for product in products:
-            product_title = product["product_title"]
+            product_title = sys.intern(product["product_title"])
             product_price = product["product_price"]
-            product_img = product["image_src"]
-            if product_title not in self.data_cache or product_price != self.data_cache[product_title][0]:
-                product_img_path = self.download_image(product_img, product_title)
-                self.data_cache[product_title] = [product_price, product_img_path]
-            self.data_cache[product_title][0] = product_price
-
-    def db_cache_to_dict(self) -> list[dict[str, any]]:
-        """
-        Return local storage cache in list of dicts format
-
-        Returns list of dicts with product information
-        """
-        return [{"product_title": k, "product_price": v[0], "path_to_image": v[1]} for k, v in self.data_cache.items()]
-
-                
-    def download_image(self, url: str, title: str) -> str:
+            cached = self.data_cache.get(product_title)
+            if cached is not None and cached.product_price == product_price:
+                continue
+            if cached is None:
+                to_download.append((product_title, product_price, product["image_src"]))
+            else:
+                cached.product_price = product_price
+                self.updated_count += 1
+                self.dirty_titles.add(product_title)
+        paths = await asyncio.gather(
+            *[self.download_image(img, title) for title, _, img in to_download]
+        )
+        for (product_title, product_price, _), product_img_path in zip(to_download, paths):
+            self.data_cache[product_title] = Entry(product_title, product_price, product_img_path)
+            self.updated_count += 1
+            self.dirty_titles.add(product_title)
+
+    async def download_image(self, url: str, title: str) -> str:
         """
         Download image from url and save it in local storage
         Return the path of image relative to this file
@@ -330,54 +691,97 @@ class ScrapingManager:
         directory = os.path.join(os.getcwd(), relative_path)
         ext = url.split(".")[-1]
         os.makedirs(directory, exist_ok=True)
-        image_path = f"{relative_path}/{title}.{ext}"
+        # Name the file after the URL hash: titles can repeat or hold
+        # path-hostile characters, and an already-downloaded image can be
+        # recognized without fetching a byte
+        url_hash = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        image_path = f"{relative_path}/{url_hash}.{ext}"
+        if os.path.exists(image_path):
+            return image_path
 
-        # Downloading image synchronously, could be done asynchronously for better performance
+        # Stream the response to disk without blocking the event loop;
+        # the semaphore caps how many downloads run at the same time
         try:
-            with requests.get(url, stream=True) as r:
-                r.raise_for_status()
-                with open(image_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+            async with self.image_semaphore:
+                async with self.scraper.session.stream("GET", url) as r:
+                    r.raise_for_status()
+                    async with aiofiles.open(image_path, 'wb') as f:
+                        async for chunk in r.aiter_bytes(64 * 1024):
+                            await f.write(chunk)
             return image_path
         except Exception:
             print(url,"not downloaded")
             return "not downloaded"
 
-        # Todo: Future scope: 
-        # - Asynchronous downloading: Consider using asynchronous libraries like aiohttp
-        #   to download images concurrently, improving performance.
-        # - Offloading to another service: Instead of saving locally, consider offloading 
+        # Todo: Future scope:
+        # - Offloading to another service: Instead of saving locally, consider offloading
         #   image storage to a cloud service like AWS S3 and downloading could be offloaded to a
         #   separate service or atleast a lambda function that is benfecial if we don't need the images immedietely.
         #   This would provide scalability, durability, and easier management of images.
-        # - Error handling and retries: Implement robust error handling and retries
-        #   for network failures or other issues during image download.
 
 
-        return image_path
 
 
 
+app = FastAPI()
+
+# In-process job registry: {job_id: {"status": ..., ...}}
+# For scrapes that must survive a process restart, move this to Redis
+# and run the jobs on a worker queue (arq/rq) instead
+_jobs: dict[str, dict] = {}
 
 
-app = FastAPI()
+async def _run_scrape(job_id: str, url: str, pages: int, proxy: Optional[str], max_rate: float):
+    """
+    Execute one scrape session in the background and record its status
+
+    job_id: str - identifier returned to the client for polling
+    url: str - target website URL
+    pages: int - number of pages to scrape
+    proxy: str or None - proxy server address
+    max_rate: float - maximum page requests per second
+    """
+    _jobs[job_id]["status"] = "running"
+    # Proxy while I added but wasn't able to test it as of now
+    scraper = Scraper(proxy=proxy, max_rate=max_rate)
+    try:
+        storage = RedisStorage()
+    except Exception as e:
+        print(f"Redis unavailable ({e}), falling back to local JSON storage")
+        storage = LocalStorage("scraped_data.json")
+    notifier = Notifier()
+
+    scraping_manager = ScrapingManager(scraper, storage, notifier)
+    try:
+        await scraping_manager.scrape_and_store(url, pages=pages)
+        _jobs[job_id]["status"] = "completed"
+        _jobs[job_id]["updated"] = scraping_manager.updated_count
+    except Exception as e:
+        print(f"Scrape job {job_id} failed: {e}")
+        _jobs[job_id]["status"] = "failed"
+        _jobs[job_id]["error"] = str(e)
+    finally:
+        await scraper.close()
+        scraping_manager.close()
+
 
 @app.get("/")
 async def hello():
     return {"message": "Hello World"}
 
 
-@app.get("/scrape/")
+@app.post("/scrape/")
 async def read_items(
+    background: BackgroundTasks,
     # lt(less than) Could be dynamic here and could be possibly scraped in regular intervals before hand
     pages: int = Query(default=1, ge=1, lt=120, description="Number of pages to scrape", alias="pages"),
     proxy: Optional[str] = Query(default=None, description="Proxy server address", alias="proxy"),
+    max_rate: float = Query(default=5.0, gt=0, le=50, description="Max page requests per second", alias="max_rate"),
     x_token: str = Header(...),
 ):
     """
-    Scrape Dentalstall website
+    Start scraping the Dentalstall website in the background
+    Returns a job_id that can be polled on GET /scrape/{job_id}
     """
     assert x_token == "my_static_token", "Invalid token"
     assert isinstance(pages, int), f"pages must be an integer, got {type(pages).__name__}"
@@ -385,16 +789,23 @@ async def read_items(
         assert isinstance(proxy, str), f"proxy must be a string, got {type(proxy).__name__}"
 
     url = "https://dentalstall.com/shop/"
-    # Proxy while I added but wasn't able to test it as of now
-    scraper = Scraper(proxy=proxy)
-    storage = LocalStorage("scraped_data.json")
-    notifier = Notifier()
-    
-    scraping_manager = ScrapingManager(scraper, storage, notifier)
-    scraping_manager.scrape_and_store(url, pages=pages)
-    # We could possible put this entire operation behind a message queue which could polled when needed as part of future scope
-    # As scraping in some cases does take time and we don't want to block the rest of the application
-    # and avoid possible 504 Timeout errors errors
-    return {"message": "Scraping completed"}
+    job_id = uuid4().hex
+    _jobs[job_id] = {"status": "queued"}
+    # The scrape runs after the response is sent, so the client gets the
+    # job_id immediately instead of holding the connection open for minutes
+    background.add_task(_run_scrape, job_id, url, pages, proxy, max_rate)
+    return {"job_id": job_id, "message": "Scraping started"}
+
+
+@app.get("/scrape/{job_id}")
+async def scrape_status(job_id: str, x_token: str = Header(...)):
+    """
+    Report the status of a background scrape job
+    """
+    assert x_token == "my_static_token", "Invalid token"
+    job = _jobs.get(job_id)
+    if job is None:
+        return {"error": "Unknown job id"}
+    return {"job_id": job_id, **job}
 
 